@@ -47,7 +47,7 @@ Commands:
     select <@ref|sel> <val>     Select dropdown option
     check <@ref|sel>            Toggle checkbox on
     uncheck <@ref|sel>          Uncheck checkbox (only if checked)
-    press <key>                 Press keyboard key
+    press <key...>              Press keys or chords (Tab Enter, Control+a)
     scroll <dir> <amount>       Scroll (up/down/left/right)
     scrollintoview <@ref|sel>   Scroll element into view
     highlight <@ref|sel>        Highlight element visually
@@ -61,7 +61,7 @@ Commands:
     find placeholder <t> <act>  Find by placeholder, then act
     find alt <text> <action>    Find by alt attribute, then act
     find title <text> <action>  Find by title attribute, then act
-    find first <sel> <action>   Find first matching element
+    find first <@ref|sel> <act> Find first matching element
     find last <sel> <action>    Find last matching element
     find nth <n> <sel> <action> Find nth matching element
 
@@ -137,14 +137,11 @@ Environment variables:
 import sys
 import os
 import json
-import base64
-import urllib.request
-import urllib.error
+import functools
 import time
-import tempfile
-import subprocess
 from pathlib import Path
 
+
 VERSION = "0.1.0"
 DEFAULT_DRIVER = "http://localhost:4444"
 DEFAULT_TIMEOUT = 10
@@ -169,6 +166,10 @@ SPECIAL_KEYS = {
     "end": "\uE010",
     "pageup": "\uE00E",
     "pagedown": "\uE00F",
+    "shift": "\uE008",
+    "control": "\uE009", "ctrl": "\uE009",
+    "alt": "\uE00A",
+    "meta": "\uE03D", "command": "\uE03D", "cmd": "\uE03D",
 }
 
 INTERACTIVE_QUERY = (
@@ -181,41 +182,98 @@ CURSOR_INTERACTIVE_QUERY = (
     INTERACTIVE_QUERY + ', [style*="cursor"], [class]'
 )
 
-SNAPSHOT_JS = """
-const scope = arguments[0] ? document.querySelector(arguments[0]) : document;
-if (!scope) return [];
-const query = arguments[1];
-const checkCursor = arguments[2];
-const elements = [];
+# Shared by SNAPSHOT_JS and FIND_JS; selectors are memoized per element.
+GENERATE_SELECTOR_JS = """
+const selectorCache = new WeakMap();
+const siblingInfo = new WeakMap();
+
+function sameTypePosition(el, parent) {
+    let info = siblingInfo.get(parent);
+    if (!info) {
+        info = { index: new Map(), count: new Map() };
+        for (const child of parent.children) {
+            const n = (info.count.get(child.tagName) || 0) + 1;
+            info.count.set(child.tagName, n);
+            info.index.set(child, n);
+        }
+        siblingInfo.set(parent, info);
+    }
+    return [info.index.get(el), info.count.get(el.tagName)];
+}
 
 function generateSelector(el) {
     if (el.id) return '#' + CSS.escape(el.id);
-    if (el.getAttribute('data-testid'))
-        return '[data-testid="' + el.getAttribute('data-testid') + '"]';
-    if (el.name && el.tagName === 'INPUT')
-        return el.tagName.toLowerCase() + '[name="' + el.name + '"]';
-    const parent = el.parentElement;
-    if (!parent) return el.tagName.toLowerCase();
-    const siblings = Array.from(parent.children).filter(c => c.tagName === el.tagName);
-    if (siblings.length === 1)
-        return generateSelector(parent) + ' > ' + el.tagName.toLowerCase();
-    const idx = siblings.indexOf(el) + 1;
-    return generateSelector(parent) + ' > ' + el.tagName.toLowerCase() + ':nth-child(' + idx + ')';
+    let sel = selectorCache.get(el);
+    if (sel !== undefined) return sel;
+    const tag = el.tagName.toLowerCase();
+    if (el.getAttribute('data-testid')) {
+        sel = '[data-testid="' + el.getAttribute('data-testid') + '"]';
+    } else if (el.name && el.tagName === 'INPUT') {
+        sel = tag + '[name="' + el.name + '"]';
+    } else if (!el.parentElement) {
+        sel = tag;
+    } else {
+        const [idx, count] = sameTypePosition(el, el.parentElement);
+        sel = generateSelector(el.parentElement) + ' > ' + tag;
+        if (count > 1) sel += ':nth-of-type(' + idx + ')';
+    }
+    selectorCache.set(el, sel);
+    return sel;
+}
+"""
+
+SNAPSHOT_QUERIES = {
+    "all": "*",
+    "interactive": INTERACTIVE_QUERY,
+    "cursor": CURSOR_INTERACTIVE_QUERY,
 }
 
-const candidates = scope.querySelectorAll(query);
+# Bits of the per-element flags column in a full snapshot.
+SNAPSHOT_DISABLED = 1
+SNAPSHOT_CHECKED = 2
+
+# The queries are baked into the script, so calls only send a mode name.
+SNAPSHOT_JS = GENERATE_SELECTOR_JS + f"""
+const QUERIES = {json.dumps(SNAPSHOT_QUERIES)};
+const DISABLED = {SNAPSHOT_DISABLED};
+const CHECKED = {SNAPSHOT_CHECKED};
+""" + """
+const scope = arguments[0] ? document.querySelector(arguments[0]) : document;
+const mode = arguments[1];
+// 'full' adds per-element columns for --json and annotation.
+const full = arguments[2] === 'full';
+const withHandles = arguments[3];
+const selectors = [];
+const handles = [];
+const lines = [];
+const descs = [];
+const labels = [];
+const values = [];
+const flags = [];
+const rects = [];
+const result = full
+    ? { selectors, lines, descs, labels, values, flags, rects }
+    : { selectors, lines };
+if (withHandles) result.handles = handles;
+if (!scope) return result;
+
+const candidates = scope.querySelectorAll(QUERIES[mode]);
 const seen = new Set();
+// Cursor mode keeps other candidates only if they look clickable.
+const interactive = mode === 'cursor'
+    ? new Set(scope.querySelectorAll(QUERIES.interactive)) : null;
+
+const skipTags = new Set(['script', 'style', 'link', 'meta', 'head', 'html']);
 
 candidates.forEach((el) => {
+    const tag = el.tagName.toLowerCase();
+    if (skipTags.has(tag)) return;
     const rect = el.getBoundingClientRect();
     if (rect.width === 0 || rect.height === 0) return;
-    const tag = el.tagName.toLowerCase();
-    if (['script','style','link','meta','head','html'].includes(tag)) return;
 
-    if (checkCursor && !el.matches(arguments[3])) {
-        const cs = window.getComputedStyle(el);
-        if (cs.cursor !== 'pointer') return;
-    }
+    // Check the inline cursor style before computing style.
+    if (interactive && !interactive.has(el) && el.style.cursor !== 'pointer' &&
+        window.getComputedStyle(el).cursor !== 'pointer') return;
 
     const sel = generateSelector(el);
     if (seen.has(sel)) return;
@@ -234,45 +292,61 @@ candidates.forEach((el) => {
     let desc = tag;
     if (type) desc += '[type=' + type + ']';
     if (role) desc += '[role=' + role + ']';
-
-    elements.push({
-        selector: sel,
-        desc: desc,
-        label: ariaLabel || text || placeholder || name || '',
-        disabled: disabled,
-        value: value,
-        checked: checked,
-        rect: { x: rect.x, y: rect.y, w: rect.width, h: rect.height },
-    });
+    const label = ariaLabel || text || placeholder || name || '';
+
+    selectors.push(sel);
+    if (withHandles) handles.push(el);
+    let line = '@e' + selectors.length + ' ' + desc;
+    if (label) line += ' "' + label + '"';
+    if (disabled) line += ' [disabled]';
+    if (value) line += ' value="' + value + '"';
+    if (checked) line += ' [checked]';
+    lines.push(line);
+    if (!full) return;
+
+    descs.push(desc);
+    labels.push(label);
+    values.push(value);
+    flags.push((disabled ? DISABLED : 0) | (checked ? CHECKED : 0));
+    rects.push(rect.x, rect.y, rect.width, rect.height);
 });
-return elements;
+return result;
 """
 
-FIND_JS = """
+FIND_JS = GENERATE_SELECTOR_JS + """
 const strategy = arguments[0];
 const value = arguments[1];
 const nameFilter = arguments[2];
+const quoted = value.replace(/"/g, '\\\\"');
 let el = null;
 
 if (strategy === 'text') {
-    const all = document.querySelectorAll('*');
-    for (const candidate of all) {
-        if (candidate.children.length === 0 &&
-            candidate.textContent.trim().includes(value)) {
-            el = candidate;
+    // The first matching text node sits inside the most specific element.
+    const root = document.body || document.documentElement;
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        const parent = node.parentElement;
+        if (parent && parent.tagName !== 'SCRIPT' && parent.tagName !== 'STYLE' &&
+            node.nodeValue.includes(value)) {
+            el = parent;
             break;
         }
     }
-    if (!el) {
-        for (const candidate of all) {
-            if (candidate.textContent.trim().includes(value)) {
-                el = candidate;
-                break;
+    // Text split across inline elements: take the deepest container.
+    if (!el && root.textContent.includes(value)) {
+        el = root;
+        let next = el;
+        while (next) {
+            next = null;
+            for (const child of el.children) {
+                if (child.textContent.includes(value)) { next = child; break; }
             }
+            if (next) el = next;
         }
     }
 } else if (strategy === 'label') {
-    el = document.querySelector('[aria-label="' + value.replace(/"/g, '\\\\"') + '"]');
+    el = document.querySelector('[aria-label="' + quoted + '"]');
 } else if (strategy === 'role') {
     const implicitRoleTags = {
         button: 'button', link: 'a', textbox: 'input,textarea',
@@ -297,11 +371,11 @@ if (strategy === 'text') {
 } else if (strategy === 'testid') {
     el = document.querySelector('[data-testid="' + value + '"]');
 } else if (strategy === 'placeholder') {
-    el = document.querySelector('[placeholder="' + value.replace(/"/g, '\\\\"') + '"]');
+    el = document.querySelector('[placeholder="' + quoted + '"]');
 } else if (strategy === 'alt') {
-    el = document.querySelector('[alt="' + value.replace(/"/g, '\\\\"') + '"]');
+    el = document.querySelector('[alt="' + quoted + '"]');
 } else if (strategy === 'title') {
-    el = document.querySelector('[title="' + value.replace(/"/g, '\\\\"') + '"]');
+    el = document.querySelector('[title="' + quoted + '"]');
 } else if (strategy === 'first') {
     el = document.querySelector(value);
 } else if (strategy === 'last') {
@@ -314,23 +388,7 @@ if (strategy === 'text') {
 }
 
 if (!el) return null;
-
-function generateSelector(el) {
-    if (el.id) return '#' + CSS.escape(el.id);
-    if (el.getAttribute('data-testid'))
-        return '[data-testid="' + el.getAttribute('data-testid') + '"]';
-    if (el.name && el.tagName === 'INPUT')
-        return el.tagName.toLowerCase() + '[name="' + el.name + '"]';
-    const parent = el.parentElement;
-    if (!parent) return el.tagName.toLowerCase();
-    const siblings = Array.from(parent.children).filter(c => c.tagName === el.tagName);
-    if (siblings.length === 1)
-        return generateSelector(parent) + ' > ' + el.tagName.toLowerCase();
-    const idx = siblings.indexOf(el) + 1;
-    return generateSelector(parent) + ' > ' + el.tagName.toLowerCase() + ':nth-child(' + idx + ')';
-}
-
-return generateSelector(el);
+return [generateSelector(el), el];
 """
 
 W3C_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
@@ -376,18 +434,64 @@ if (!window.__TAURI_BROWSE_CONSOLE__) {
 """
 
 
+SCROLL_AND_SETTLE_JS = """
+const done = arguments[arguments.length - 1];
+window.scrollTo(0, arguments[0]);
+requestAnimationFrame(() => requestAnimationFrame(() => done()));
+"""
+
+# Polls WAIT_CHECK in the page until it holds or arguments[0] ms pass.
+WAIT_UNTIL_JS = """
+const done = arguments[arguments.length - 1];
+const budget = arguments[0];
+const start = Date.now();
+const check = WAIT_CHECK;
+(function poll() {
+    let ok = false;
+    try { ok = check(); } catch (e) {}
+    if (ok) return done(true);
+    if (Date.now() - start >= budget) return done(false);
+    setTimeout(poll, 25);
+})();
+"""
+
+# document.readyState has stayed "complete" for 500ms.
+NETWORK_IDLE_CHECK = """(() => {
+    let since = null;
+    return () => {
+        if (document.readyState !== 'complete') {
+            since = null;
+            return false;
+        }
+        if (since === null) since = Date.now();
+        return Date.now() - since >= 500;
+    };
+})()"""
+
+# What a driver reports when navigation interrupts an async script
+SCRIPT_INTERRUPTED_ERRORS = ("javascript error", "script timeout")
+
+
 # --- Configuration ---
 
+# Reads /proc directly rather than forking pgrep
 def detect_xvfb_display():
     try:
-        out = subprocess.check_output(
-            ["pgrep", "-a", "Xvfb"], text=True, stderr=subprocess.DEVNULL)
-        for line in out.strip().splitlines():
-            for token in line.split():
-                if token.startswith(":"):
-                    return token
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+        pids = sorted(int(name) for name in os.listdir("/proc")
+                      if name.isdigit())
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv = f.read().split(b"\0")
+        except OSError:
+            continue
+        if os.path.basename(argv[0]) != b"Xvfb":
+            continue
+        for arg in argv[1:]:
+            if arg.startswith(b":"):
+                return arg.decode()
     return None
 
 
@@ -484,49 +588,144 @@ class Config:
 
 # --- HTTP / WebDriver ---
 
-def request(driver, method, url, body=None, timeout=DEFAULT_TIMEOUT):
-    data = json.dumps(body).encode() if body is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        method=method,
-        headers={"Content-Type": "application/json"} if data else {},
-    )
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Use orjson when installed (the "fast" extra), json for what it rejects
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _json_pretty(obj):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(raw):
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+# Idle keep-alive connections, keyed by (scheme, host, port)
+_idle_connections = {}
+
+
+def _connection_key(url):
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return (parts.scheme, parts.hostname, parts.port), path
+
+
+def _acquire_connection(key, timeout):
+    import http.client
+
+    # A bare pop() keeps this safe when several threads share the pool.
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
+        conn = _idle_connections.get(key, []).pop()
+    except IndexError:
+        pass
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+    scheme, host, port = key
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout)
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _release_connection(key, conn):
+    _idle_connections.setdefault(key, []).append(conn)
+
+
+def http_call(method, url, body=None, timeout=DEFAULT_TIMEOUT):
+    # Returns (status, raw body)
+    import http.client
+
+    key, path = _connection_key(url)
+    data = _json_dumps(body) if body is not None else None
+    while True:
+        conn = _acquire_connection(key, timeout)
+        reused = conn.sock is not None
         try:
-            error_json = json.loads(error_body)
-            msg = error_json.get("value", {}).get("message", error_body)
-        except (json.JSONDecodeError, AttributeError):
-            msg = error_body
-        print(f"Error: {msg}", file=sys.stderr)
+            conn.request(method, path, body=data,
+                         headers=JSON_HEADERS if data is not None else {})
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError,
+                BrokenPipeError):
+            conn.close()
+            # The driver may drop an idle socket; retry on a new connection
+            if reused:
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        _release_connection(key, conn)
+        return resp.status, raw
+
+
+def request(driver, method, url, body=None, timeout=DEFAULT_TIMEOUT,
+            tolerate=()):
+    import http.client
+
+    try:
+        status, raw = http_call(method, url, body, timeout)
+    except TimeoutError:
+        print(f"Request timed out after {timeout}s: {method} {url}",
+              file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        reason = getattr(e, "reason", e)
-        print(f"Cannot connect to WebDriver at {driver}: {reason}",
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Cannot connect to WebDriver at {driver}: {e}",
               file=sys.stderr)
         print("Make sure tauri-driver is running.", file=sys.stderr)
         sys.exit(1)
-    except TimeoutError:
-        print(f"Request timed out after {timeout}s: {method} {url}",
-              file=sys.stderr)
+    if status >= 400:
+        error_body = raw.decode()
+        try:
+            error_json = _json_loads(raw)
+            error = error_json.get("value", {}).get("error", "")
+            msg = error_json.get("value", {}).get("message", error_body)
+        except (json.JSONDecodeError, AttributeError):
+            error, msg = "", error_body
+        # Callers that can recover (e.g. from a stale element id) get None
+        if error in tolerate:
+            return None
+        print(f"Error: {msg}", file=sys.stderr)
         sys.exit(1)
+    return _json_loads(raw)
 
 
 def request_quiet(method, url, body=None, timeout=DEFAULT_TIMEOUT):
-    data = json.dumps(body).encode() if body is not None else None
-    req = urllib.request.Request(
-        url,
-        data=data,
-        method=method,
-        headers={"Content-Type": "application/json"} if data else {},
-    )
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read())
+        status, raw = http_call(method, url, body, timeout)
+        if status >= 400:
+            return None
+        return _json_loads(raw)
     except Exception:
         return None
 
@@ -546,23 +745,58 @@ def session_path(name):
     return SESSIONS_DIR / f"{name}.json"
 
 
+# Parsed session files, keyed by name: (file signature, data)
+_state_cache = {}
+
+
+# Session values are flat, so a one-level copy detaches them
+def _copy_state(data):
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in data.items()}
+
+
+def _file_signature(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 def save_session(name, data):
+    path = session_path(name)
+    cached = _state_cache.get(name)
+    if cached and cached[1] == data:
+        # Nothing changed since this process last read or wrote the file
+        try:
+            if _file_signature(path) == cached[0]:
+                return
+        except FileNotFoundError:
+            pass
     ensure_dirs()
-    with open(session_path(name), "w") as f:
-        json.dump(data, f)
+    # Write beside the target and rename, so readers never see a partial file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_json_dumps(data))
+    os.replace(tmp, path)
+    _state_cache[name] = (_file_signature(path), _copy_state(data))
 
 
 def load_session(name):
+    path = session_path(name)
     try:
-        with open(session_path(name)) as f:
-            return json.load(f)
+        signature = _file_signature(path)
+        cached = _state_cache.get(name)
+        if cached and cached[0] == signature:
+            return _copy_state(cached[1])
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
     except (FileNotFoundError, KeyError, json.JSONDecodeError):
         print(f"No active session '{name}'. Run 'tauri-browse launch <binary>' first.",
               file=sys.stderr)
         sys.exit(1)
+    _state_cache[name] = (signature, _copy_state(data))
+    return data
 
 
 def delete_session(name):
+    _state_cache.pop(name, None)
     try:
         session_path(name).unlink()
     except FileNotFoundError:
@@ -574,8 +808,8 @@ def list_sessions():
     sessions = []
     for p in SESSIONS_DIR.glob("*.json"):
         try:
-            with open(p) as f:
-                data = json.load(f)
+            with open(p, "rb") as f:
+                data = _json_loads(f.read())
             sessions.append({
                 "name": p.stem,
                 "session_id": data.get("session_id", "unknown"),
@@ -606,6 +840,42 @@ def find_element(config, sid, selector):
     return list(resp["value"].values())[0]
 
 
+# Errors meaning a cached element id no longer refers to a live element
+STALE_ELEMENT_ERRORS = ("stale element reference", "no such element")
+
+
+def element_request(config, state, target, *actions):
+    # A snapshot @ref reuses its cached element id; a stale one is re-found
+    base = surl(config.driver, state["session_id"])
+    selector = resolve_target(state, target)
+    is_ref = target.startswith("@e")
+    cache = state.setdefault("element_cache", {})
+    element_id = cache.get(selector) if is_ref else None
+    if element_id is not None:
+        action, body = actions[0]
+        resp = request(config.driver, "POST",
+                       f"{base}/element/{element_id}/{action}", body,
+                       tolerate=STALE_ELEMENT_ERRORS)
+        if resp is None:
+            element_id = None
+        else:
+            actions = actions[1:]
+    if element_id is None:
+        element_id = find_element(config, state["session_id"], selector)
+        if is_ref:
+            cache[selector] = element_id
+            save_session(config.session, state)
+    for action, body in actions:
+        request(config.driver, "POST",
+                f"{base}/element/{element_id}/{action}", body)
+
+
+def reset_element_cache(config, state):
+    if state.get("element_cache"):
+        state["element_cache"] = {}
+        save_session(config.session, state)
+
+
 def try_find_element(config, sid, selector):
     result = request_quiet(
         "POST", f"{surl(config.driver, sid)}/element",
@@ -615,60 +885,83 @@ def try_find_element(config, sid, selector):
     return None
 
 
+# Returns (selector, element id); FIND_JS returns the element itself
 def find_by_strategy(config, sid, strategy, value, name_filter=None):
     resp = request(config.driver, "POST",
                    f"{surl(config.driver, sid)}/execute/sync", {
                        "script": FIND_JS,
                        "args": [strategy, value, name_filter],
                    })
-    selector = resp["value"]
-    if not selector:
+    if not resp["value"]:
         print(f"Element not found: {strategy}={value}", file=sys.stderr)
         sys.exit(1)
-    return selector
+    selector, element = resp["value"]
+    if isinstance(element, dict) and W3C_ELEMENT_KEY in element:
+        return selector, element[W3C_ELEMENT_KEY]
+    return selector, find_element(config, sid, selector)
+
+
+# Returns (selector, element id); the id is None for a snapshot @ref
+def resolve_find(config, state, strategy, value, name_filter=None):
+    if strategy != "first":
+        return find_by_strategy(config, state["session_id"], strategy,
+                                value, name_filter)
+    # POST /element returns the first match just as querySelector does.
+    selector = resolve_target(state, value)
+    if value.startswith("@e"):
+        return selector, None
+    element_id = try_find_element(config, state["session_id"], selector)
+    if element_id is None:
+        print(f"Element not found: {strategy}={value}", file=sys.stderr)
+        sys.exit(1)
+    return selector, element_id
+
+
+def find_request(config, state, target, element_id, *actions):
+    if element_id is None:
+        return element_request(config, state, target, *actions)
+    base = surl(config.driver, state["session_id"])
+    for action, body in actions:
+        request(config.driver, "POST",
+                f"{base}/element/{element_id}/{action}", body)
 
 
 # --- Snapshot ---
 
 def collect_snapshot(config, sid, interactive, scope,
-                     cursor_interactive=False):
+                     cursor_interactive=False, want_elements=False,
+                     want_handles=False):
     if cursor_interactive:
-        query = CURSOR_INTERACTIVE_QUERY
+        mode = "cursor"
     elif interactive:
-        query = INTERACTIVE_QUERY
+        mode = "interactive"
     else:
-        query = '*'
+        mode = "all"
 
     resp = request(config.driver, "POST",
                    f"{surl(config.driver, sid)}/execute/sync", {
                        "script": SNAPSHOT_JS,
-                       "args": [scope, query, cursor_interactive,
-                                INTERACTIVE_QUERY],
+                       "args": [scope, mode,
+                                "full" if want_elements else "lines",
+                                want_handles],
                    })
-    elements = resp["value"]
-    refs = {}
-    lines = []
-    for i, el in enumerate(elements):
-        ref = f"@e{i + 1}"
-        refs[ref] = el["selector"]
-        desc = el["desc"]
-        label = el["label"]
-        parts = [ref, desc]
-        if label:
-            parts.append(f'"{label}"')
-        if el["disabled"]:
-            parts.append("[disabled]")
-        if el["value"]:
-            parts.append(f'value="{el["value"]}"')
-        if el["checked"]:
-            parts.append("[checked]")
-        lines.append(" ".join(parts))
-    return refs, lines, elements
+    result = resp["value"]
+    selectors = result["selectors"]
+    refs = {f"@e{i + 1}": sel for i, sel in enumerate(selectors)}
+    # With want_handles, each element comes back as a web element reference
+    element_cache = {}
+    for sel, handle in zip(selectors, result.pop("handles", ())):
+        if isinstance(handle, dict) and W3C_ELEMENT_KEY in handle:
+            element_cache[sel] = handle[W3C_ELEMENT_KEY]
+    return (refs, result["lines"], result if want_elements else None,
+            element_cache)
 
 
 # --- Screenshot ---
 
 def webdriver_screenshot(config, sid):
+    import base64
+
     url = f"{surl(config.driver, sid)}/screenshot"
     result = request_quiet("GET", url, timeout=3)
     if result and "value" in result:
@@ -676,76 +969,113 @@ def webdriver_screenshot(config, sid):
     return None
 
 
-def x_display_screenshot(path):
+# One mss grabber per process, reused for every segment
+_mss_grabber = None
+
+
+def _grab_with_mss():
+    # mss captures in-process; None means fall back to ImageMagick.
+    global _mss_grabber
+    try:
+        import mss
+        from mss.exception import ScreenShotError
+    except ImportError:
+        return None
+    try:
+        if _mss_grabber is None:
+            _mss_grabber = mss.mss()
+        return _mss_grabber.grab(_mss_grabber.monitors[0])
+    except ScreenShotError:
+        return None
+
+
+def _write_png(shot, path):
+    # With no path the encoded PNG is returned instead of written.
+    import mss.tools
+    return mss.tools.to_png(shot.rgb, shot.size, level=1, output=path)
+
+
+def x_display_screenshot(path=None, writer=None):
+    # With a writer executor, returns the pending PNG-encoding future
     display = os.environ.get("DISPLAY")
     if not display:
         print("Screenshot failed: no DISPLAY set. Use --display or set DISPLAY.",
               file=sys.stderr)
         sys.exit(1)
+    shot = _grab_with_mss()
+    if shot is not None:
+        if writer is not None:
+            return writer.submit(_write_png, shot, path)
+        return _write_png(shot, path)
+    import subprocess
     result = subprocess.run(
-        ["import", "-window", "root", path],
+        ["import", "-window", "root", path or "png:-"],
         capture_output=True,
     )
     if result.returncode != 0:
         print(f"Screenshot failed: {result.stderr.decode().strip()}",
               file=sys.stderr)
         sys.exit(1)
+    return None if path else result.stdout
 
 
-def capture_screenshot(config, sid, path):
+def capture_screenshot(config, sid, path=None, writer=None):
     display = os.environ.get("DISPLAY")
     if display:
-        x_display_screenshot(path)
+        return x_display_screenshot(path, writer)
     else:
         png_data = webdriver_screenshot(config, sid)
-        if png_data:
-            with open(path, "wb") as f:
-                f.write(png_data)
-        else:
+        if not png_data:
             print("Screenshot failed: WebDriver timed out and no DISPLAY set.",
                   file=sys.stderr)
             sys.exit(1)
+        if path is None:
+            return png_data
+        with open(path, "wb") as f:
+            f.write(png_data)
+    return None
 
 
 def capture_full_screenshot(config, sid, path):
-    scroll_h = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
-                           "script": "return document.documentElement.scrollHeight",
-                           "args": [],
-                       })["value"]
-    viewport_h = request(config.driver, "POST",
-                         f"{surl(config.driver, sid)}/execute/sync", {
-                             "script": "return window.innerHeight",
-                             "args": [],
-                         })["value"]
+    import tempfile
+
+    base = surl(config.driver, sid)
+    scroll_h, viewport_h = request(
+        config.driver, "POST", f"{base}/execute/sync", {
+            "script": "return [document.documentElement.scrollHeight, "
+                      "window.innerHeight]",
+            "args": [],
+        })["value"]
 
     if scroll_h <= viewport_h:
         capture_screenshot(config, sid, path)
         return
 
+    from concurrent.futures import ThreadPoolExecutor
+
     segments = []
+    pending = []
     offset = 0
-    while offset < scroll_h:
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/execute/sync", {
-                    "script": f"window.scrollTo(0, {offset})",
-                    "args": [],
-                })
-        time.sleep(0.15)
-        seg_path = os.path.join(tempfile.gettempdir(),
-                                f"tb-seg-{len(segments)}.png")
-        capture_screenshot(config, sid, seg_path)
-        segments.append(seg_path)
-        offset += viewport_h
-
-    # Stitch segments vertically with ImageMagick
-    result = subprocess.run(
-        ["convert", "-append"] + segments + [path],
-        capture_output=True,
-    )
-    if result.returncode != 0:
-        print(f"Stitch failed: {result.stderr.decode().strip()}",
-              file=sys.stderr)
+    # Each segment is encoded on a worker while the next one is grabbed
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        while offset < scroll_h:
+            # Resolves once the scrolled content has been painted
+            request(config.driver, "POST",
+                    f"{base}/execute/async", {
+                        "script": SCROLL_AND_SETTLE_JS,
+                        "args": [offset],
+                    })
+            seg_path = os.path.join(tempfile.gettempdir(),
+                                    f"tb-seg-{len(segments)}.png")
+            write = capture_screenshot(config, sid, seg_path, writer)
+            if write is not None:
+                pending.append(write)
+            segments.append(seg_path)
+            offset += viewport_h
+    for write in pending:
+        write.result()
+
+    if not stitch_vertical(segments, path):
         # Fall back to first segment
         import shutil
         shutil.copy2(segments[0], path)
@@ -755,23 +1085,95 @@ def capture_full_screenshot(config, sid, path):
 
     # Restore scroll position
     request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/execute/sync", {
+            f"{base}/execute/sync", {
                 "script": "window.scrollTo(0, 0)",
                 "args": [],
             })
 
 
-def annotate_screenshot(path, elements):
+def stitch_vertical(segments, path):
+    # Pillow stitches in-process; without it, fall back to ImageMagick.
+    try:
+        from PIL import Image
+    except ImportError:
+        import subprocess
+        result = subprocess.run(
+            ["convert", "-append"] + segments + [path],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            print(f"Stitch failed: {result.stderr.decode().strip()}",
+                  file=sys.stderr)
+            return False
+        return True
+
+    images = [Image.open(seg) for seg in segments]
+    canvas = Image.new("RGB", (max(im.width for im in images),
+                               sum(im.height for im in images)))
+    y = 0
+    for im in images:
+        canvas.paste(im, (0, y))
+        y += im.height
+    canvas.save(path, compress_level=1)
+    return True
+
+
+BADGE_HEIGHT = 14
+
+
+@functools.lru_cache(maxsize=None)
+def _badge_font():
+    from PIL import ImageFont
+    return ImageFont.load_default()
+
+
+# Badge backgrounds only vary with the digit count, so each is drawn once
+@functools.lru_cache(maxsize=None)
+def _badge_background(digits):
+    from PIL import Image, ImageDraw
+    badge_w = 6 + digits * 8
+    badge = Image.new("RGBA", (badge_w + 1, BADGE_HEIGHT + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(badge).rounded_rectangle(
+        [0, 0, badge_w, BADGE_HEIGHT], radius=2, fill=(220, 38, 38, 230))
+    mask = badge.getchannel("A").point(lambda a: 255 if a else 0)
+    return badge, mask
+
+
+# rects is a snapshot's flat [x, y, w, h, ...] column, in ref order.
+def annotate_screenshot(path, rects):
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        _annotate_with_convert(path, rects)
+        return
+
+    image = Image.open(path)
+    mode = image.mode if image.mode in ("RGB", "RGBA") else "RGB"
+    base = image.convert("RGBA")
+    overlay = Image.new("RGBA", base.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    font = _badge_font()
+    it = map(int, rects)
+    for i, (x, y, w, h) in enumerate(zip(it, it, it, it)):
+        num = str(i + 1)
+        bx, by = max(x - 1, 0), max(y - 1, 0)
+        draw.rectangle([x, y, x + w, y + h],
+                       outline=(59, 130, 246, 128), width=1)
+        badge, mask = _badge_background(len(num))
+        overlay.paste(badge, (bx, by), mask)
+        draw.text((bx + 2, by + 1), num, fill=(255, 255, 255, 255),
+                  font=font)
+    Image.alpha_composite(base, overlay).convert(mode).save(path)
+
+
+def _annotate_with_convert(path, rects):
+    import subprocess
+
     cmd = ["convert", path]
-    for i, el in enumerate(elements):
-        rect = el.get("rect")
-        if not rect:
-            continue
-        x, y = int(rect["x"]), int(rect["y"])
-        w, h = int(rect["w"]), int(rect["h"])
+    it = map(int, rects)
+    for i, (x, y, w, h) in enumerate(zip(it, it, it, it)):
         num = str(i + 1)
         badge_w = 6 + len(num) * 8
-        badge_h = 14
         bx, by = max(x - 1, 0), max(y - 1, 0)
         cmd.extend([
             "-stroke", "rgba(59,130,246,0.5)", "-strokewidth", "1",
@@ -780,7 +1182,7 @@ def annotate_screenshot(path, elements):
         ])
         cmd.extend([
             "-stroke", "none", "-fill", "rgba(220,38,38,0.9)",
-            "-draw", f"roundrectangle {bx},{by} {bx + badge_w},{by + badge_h} 2,2",
+            "-draw", f"roundrectangle {bx},{by} {bx + badge_w},{by + BADGE_HEIGHT} 2,2",
         ])
         cmd.extend([
             "-fill", "white", "-pointsize", "11",
@@ -793,12 +1195,115 @@ def annotate_screenshot(path, elements):
               file=sys.stderr)
 
 
+def image_size(path):
+    # PNG stores width and height at a fixed offset in its IHDR chunk
+    import struct
+    try:
+        with open(path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    try:
+        from PIL import Image
+    except ImportError:
+        import subprocess
+        result = subprocess.run(
+            ["identify", "-format", "%w %h", path],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            return None
+        width, height = result.stdout.strip().split()[:2]
+        return int(width), int(height)
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except OSError:
+        return None
+
+
+# Like `compare -fuzz 5%`: RGB distance above this fraction is a change
+DIFF_FUZZ = 0.05
+# compare's default highlight colour
+DIFF_HIGHLIGHT = (241, 0, 30)
+
+
+def _open_image(image, label):
+    import io
+    from PIL import Image
+    if isinstance(image, bytes):
+        name, image = f"{label} image", io.BytesIO(image)
+    else:
+        name = f"{label} {image}"
+    # OSError covers a missing file as well as PIL's UnidentifiedImageError.
+    try:
+        with Image.open(image) as im:
+            return im.convert("RGB")
+    except OSError as e:
+        print(f"Error: cannot read {name}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _diff_with_pillow(baseline, current, output):
+    from PIL import Image, ImageChops
+    old = _open_image(baseline, "baseline")
+    new = _open_image(current, "current")
+    if old.size != new.size:
+        print("Diff pixels: image sizes differ "
+              f"({old.size[0]}x{old.size[1]} vs {new.size[0]}x{new.size[1]})")
+        return
+    # Halved squares, so the fuzz limit fits within an 8-bit band
+    squares = [min(255, d * d // 2) for d in range(256)]
+    delta = ImageChops.difference(old, new).point(squares * 3)
+    red, green, blue = delta.split()
+    distance = ImageChops.add(ImageChops.add(red, green), blue)
+    limit = int(3 * (DIFF_FUZZ * 255) ** 2 / 2)
+    mask = distance.point(lambda v: 255 if v > limit else 0)
+    # Like compare's output: the current image washed out, changes in red.
+    canvas = Image.blend(new, Image.new("RGB", new.size, "white"), 0.7)
+    canvas.paste(DIFF_HIGHLIGHT, mask=mask)
+    canvas.save(output, compress_level=1)
+    diff_pixels = mask.histogram()[255]
+    pct = (diff_pixels / (new.size[0] * new.size[1])) * 100
+    print(f"Diff pixels: {diff_pixels} ({pct:.2f}%)")
+    print(f"Diff image: {output}")
+
+
 def diff_screenshots(baseline, current, output):
-    result = subprocess.run(
-        ["compare", "-metric", "AE", "-fuzz", "5%",
-         baseline, current, output],
-        capture_output=True,
-    )
+    # baseline and current are PNG paths or bytes; only compare needs files
+    try:
+        _diff_with_pillow(baseline, current, output)
+        return
+    except ImportError:
+        pass
+
+    import subprocess
+    import tempfile
+
+    temps = []
+    paths = []
+    for image in (baseline, current):
+        if isinstance(image, bytes):
+            fd, image_path = tempfile.mkstemp(prefix="tb-diff-", suffix=".png")
+            with os.fdopen(fd, "wb") as f:
+                f.write(image)
+            temps.append(image_path)
+            image = image_path
+        paths.append(image)
+    baseline, current = paths
+    try:
+        result = subprocess.run(
+            ["compare", "-metric", "AE", "-fuzz", "5%",
+             baseline, current, output],
+            capture_output=True,
+        )
+        # Get image dimensions for percentage calculation
+        size = image_size(baseline)
+    finally:
+        for path in temps:
+            os.unlink(path)
     # compare returns exit code 1 if images differ, 0 if identical
     stderr = result.stderr.decode().strip()
     try:
@@ -806,14 +1311,8 @@ def diff_screenshots(baseline, current, output):
     except ValueError:
         diff_pixels = -1
 
-    # Get image dimensions for percentage calculation
-    identify = subprocess.run(
-        ["identify", "-format", "%w %h", baseline],
-        capture_output=True, text=True,
-    )
-    if identify.returncode == 0:
-        parts = identify.stdout.strip().split()
-        total = int(parts[0]) * int(parts[1])
+    if size:
+        total = size[0] * size[1]
         if total > 0 and diff_pixels >= 0:
             pct = (diff_pixels / total) * 100
             print(f"Diff pixels: {diff_pixels} ({pct:.2f}%)")
@@ -847,8 +1346,8 @@ def cmd_launch(config, args):
     }, timeout=30)
     sid = resp["value"]["sessionId"]
     save_session(config.session, {
-        "session_id": sid, "refs": {}, "last_snapshot": "",
-        "last_screenshot": "",
+        "session_id": sid, "refs": {}, "element_cache": {},
+        "last_snapshot": "", "last_screenshot": "",
     })
     print(f"Session started: {sid}")
 
@@ -865,13 +1364,14 @@ def cmd_open(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
-    request(config.driver, "POST", f"{surl(config.driver, sid)}/url",
-            {"url": args[0]})
+    base = surl(config.driver, sid)
+    request(config.driver, "POST", f"{base}/url", {"url": args[0]})
+    reset_element_cache(config, state)
     # Wait for DOM to be ready before injecting console capture
     deadline = time.time() + config.timeout
     while time.time() < deadline:
         resp = request_quiet("POST",
-                             f"{surl(config.driver, sid)}/execute/sync", {
+                             f"{base}/execute/sync", {
                                  "script": "return document.readyState",
                                  "args": [],
                              })
@@ -902,34 +1402,42 @@ def cmd_snapshot(config, args):
         if idx + 1 < len(args):
             scope = args[idx + 1]
 
-    refs, lines, elements = collect_snapshot(
+    refs, lines, columns, element_cache = collect_snapshot(
         config, sid, interactive or cursor_interactive, scope,
-        cursor_interactive)
+        cursor_interactive, want_elements=as_json,
+        want_handles=interactive or cursor_interactive)
+    text = "\n".join(lines)
 
     if as_json:
         output = []
-        for i, el in enumerate(elements):
+        rects = columns["rects"]
+        for i, sel in enumerate(columns["selectors"]):
+            flags = columns["flags"][i]
+            x, y, w, h = rects[4 * i:4 * i + 4]
             output.append({
                 "ref": f"@e{i + 1}",
-                "selector": el["selector"],
-                "desc": el["desc"],
-                "label": el["label"],
-                "disabled": el["disabled"],
-                "value": el["value"],
-                "checked": el["checked"],
-                "rect": el["rect"],
+                "selector": sel,
+                "desc": columns["descs"][i],
+                "label": columns["labels"][i],
+                "disabled": bool(flags & SNAPSHOT_DISABLED),
+                "value": columns["values"][i],
+                "checked": bool(flags & SNAPSHOT_CHECKED),
+                "rect": {"x": x, "y": y, "w": w, "h": h},
             })
-        print(json.dumps(output, indent=2))
-    else:
-        for line in lines:
-            print(line)
+        print(_json_pretty(output).decode())
+    elif text:
+        sys.stdout.write(text)
+        sys.stdout.write("\n")
 
     state["refs"] = refs
-    state["last_snapshot"] = "\n".join(lines)
+    state["element_cache"] = element_cache
+    state["last_snapshot"] = text
     save_session(config.session, state)
 
 
 def cmd_screenshot(config, args):
+    import tempfile
+
     state = load_session(config.session)
     sid = state["session_id"]
     do_annotate = "--annotate" in args or config.annotate
@@ -953,18 +1461,18 @@ def cmd_screenshot(config, args):
     save_session(config.session, state)
 
     if do_annotate:
-        refs, lines, elements = collect_snapshot(config, sid, True, None)
-        annotate_screenshot(path, elements)
+        refs, lines, columns, element_cache = collect_snapshot(
+            config, sid, True, None, want_elements=True, want_handles=True)
+        annotate_screenshot(path, columns["rects"])
         state["refs"] = refs
+        state["element_cache"] = element_cache
         state["last_snapshot"] = "\n".join(lines)
         save_session(config.session, state)
         print(path)
-        for i, el in enumerate(elements):
-            ref = f"@e{i + 1}"
-            desc = el["desc"]
-            label = el["label"]
+        for i, (desc, label) in enumerate(zip(columns["descs"],
+                                              columns["labels"])):
             label_str = f' "{label}"' if label else ""
-            print(f"  [{i + 1}] {ref} {desc}{label_str}")
+            print(f"  [{i + 1}] @e{i + 1} {desc}{label_str}")
     else:
         print(path)
 
@@ -975,11 +1483,7 @@ def cmd_click(config, args):
         sys.exit(1)
 
     state = load_session(config.session)
-    sid = state["session_id"]
-    selector = resolve_target(state, args[0])
-    element_id = find_element(config, sid, selector)
-    request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/element/{element_id}/click", {})
+    element_request(config, state, args[0], ("click", {}))
     print("Clicked.")
 
 
@@ -990,14 +1494,8 @@ def cmd_fill(config, args):
         sys.exit(1)
 
     state = load_session(config.session)
-    sid = state["session_id"]
-    selector = resolve_target(state, args[0])
-    element_id = find_element(config, sid, selector)
-    request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/element/{element_id}/clear", {})
-    request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/element/{element_id}/value",
-            {"text": args[1]})
+    element_request(config, state, args[0],
+                    ("clear", {}), ("value", {"text": args[1]}))
     print("Filled.")
 
 
@@ -1008,12 +1506,7 @@ def cmd_type(config, args):
         sys.exit(1)
 
     state = load_session(config.session)
-    sid = state["session_id"]
-    selector = resolve_target(state, args[0])
-    element_id = find_element(config, sid, selector)
-    request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/element/{element_id}/value",
-            {"text": args[1]})
+    element_request(config, state, args[0], ("value", {"text": args[1]}))
     print("Typed.")
 
 
@@ -1049,34 +1542,47 @@ def cmd_check(config, args):
         sys.exit(1)
 
     state = load_session(config.session)
-    sid = state["session_id"]
-    selector = resolve_target(state, args[0])
-    element_id = find_element(config, sid, selector)
-    request(config.driver, "POST",
-            f"{surl(config.driver, sid)}/element/{element_id}/click", {})
+    element_request(config, state, args[0], ("click", {}))
     print("Toggled.")
 
 
+def key_chord(name):
+    # "Control+Shift+a" -> key values; "+" alone or last is the plus key
+    if name == "+":
+        parts = ["+"]
+    elif name.endswith("++"):
+        parts = name[:-2].split("+") + ["+"]
+    else:
+        parts = name.split("+")
+    if "" in parts:
+        print("Usage: tauri-browse press <key> [key...]", file=sys.stderr)
+        sys.exit(1)
+    return [SPECIAL_KEYS.get(part) or SPECIAL_KEYS.get(part.lower(), part)
+            for part in parts]
+
+
 def cmd_press(config, args):
     if not args:
-        print("Usage: tauri-browse press <key>", file=sys.stderr)
+        print("Usage: tauri-browse press <key> [key...]", file=sys.stderr)
         sys.exit(1)
 
     state = load_session(config.session)
     sid = state["session_id"]
-    key_name = args[0]
-    value = SPECIAL_KEYS.get(key_name.lower(), key_name)
+    # One action sequence for all keys, so a single WebDriver request
+    key_actions = []
+    for key_name in args:
+        values = key_chord(key_name)
+        key_actions.extend({"type": "keyDown", "value": v} for v in values)
+        key_actions.extend({"type": "keyUp", "value": v}
+                           for v in reversed(values))
     request(config.driver, "POST", f"{surl(config.driver, sid)}/actions", {
         "actions": [{
             "type": "key",
             "id": "keyboard",
-            "actions": [
-                {"type": "keyDown", "value": value},
-                {"type": "keyUp", "value": value},
-            ]
+            "actions": key_actions,
         }]
     })
-    print(f"Pressed: {key_name}")
+    print(f"Pressed: {' '.join(args)}")
 
 
 def cmd_scroll(config, args):
@@ -1140,7 +1646,6 @@ def cmd_find(config, args):
         sys.exit(1)
 
     state = load_session(config.session)
-    sid = state["session_id"]
 
     strategy = args[0]
     value = args[1]
@@ -1168,34 +1673,28 @@ def cmd_find(config, args):
             action = args[3]
             action_args = args[4:]
 
-    selector = find_by_strategy(config, sid, strategy, value, name_filter)
-    element_id = find_element(config, sid, selector)
+    selector, element_id = resolve_find(config, state, strategy, value,
+                                        name_filter)
 
     if action == "click":
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/click", {})
+        find_request(config, state, value, element_id, ("click", {}))
         print("Clicked.")
     elif action == "fill":
         if not action_args:
             print("Usage: find ... fill <text>", file=sys.stderr)
             sys.exit(1)
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/clear", {})
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/value",
-                {"text": action_args[0]})
+        find_request(config, state, value, element_id,
+                     ("clear", {}), ("value", {"text": action_args[0]}))
         print("Filled.")
     elif action == "type":
         if not action_args:
             print("Usage: find ... type <text>", file=sys.stderr)
             sys.exit(1)
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/value",
-                {"text": action_args[0]})
+        find_request(config, state, value, element_id,
+                     ("value", {"text": action_args[0]}))
         print("Typed.")
     elif action == "check":
-        request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/click", {})
+        find_request(config, state, value, element_id, ("click", {}))
         print("Toggled.")
     elif action == "select":
         if not action_args:
@@ -1240,13 +1739,14 @@ def cmd_eval(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     resp = request(config.driver, "POST",
-                   f"{surl(config.driver, sid)}/execute/sync",
+                   f"{base}/execute/sync",
                    {"script": script, "args": []})
     result = resp["value"]
     if result is not None:
         if isinstance(result, (dict, list)):
-            print(json.dumps(result, indent=2))
+            print(_json_pretty(result).decode())
         else:
             print(result)
 
@@ -1259,15 +1759,14 @@ def cmd_get(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     subcmd = args[0]
 
     if subcmd == "url":
-        resp = request(config.driver, "GET",
-                       f"{surl(config.driver, sid)}/url")
+        resp = request(config.driver, "GET", f"{base}/url")
         print(resp["value"])
     elif subcmd == "title":
-        resp = request(config.driver, "GET",
-                       f"{surl(config.driver, sid)}/title")
+        resp = request(config.driver, "GET", f"{base}/title")
         print(resp["value"])
     elif subcmd == "text":
         if len(args) < 2:
@@ -1277,7 +1776,7 @@ def cmd_get(config, args):
         selector = resolve_target(state, args[1])
         element_id = find_element(config, sid, selector)
         resp = request(config.driver, "GET",
-                       f"{surl(config.driver, sid)}/element/{element_id}/text")
+                       f"{base}/element/{element_id}/text")
         print(resp["value"])
     elif subcmd == "html":
         if len(args) < 2:
@@ -1287,7 +1786,7 @@ def cmd_get(config, args):
         selector = resolve_target(state, args[1])
         prop = "outerHTML" if "--outer" in args else "innerHTML"
         resp = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
+                       f"{base}/execute/sync", {
                            "script": f"return document.querySelector(arguments[0]).{prop}",
                            "args": [selector],
                        })
@@ -1299,7 +1798,7 @@ def cmd_get(config, args):
             sys.exit(1)
         selector = resolve_target(state, args[1])
         resp = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
+                       f"{base}/execute/sync", {
                            "script": "return document.querySelector(arguments[0]).value",
                            "args": [selector],
                        })
@@ -1311,7 +1810,7 @@ def cmd_get(config, args):
             sys.exit(1)
         selector = resolve_target(state, args[1])
         resp = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
+                       f"{base}/execute/sync", {
                            "script": "return document.querySelector(arguments[0]).getAttribute(arguments[1])",
                            "args": [selector, args[2]],
                        })
@@ -1322,7 +1821,7 @@ def cmd_get(config, args):
                   file=sys.stderr)
             sys.exit(1)
         resp = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
+                       f"{base}/execute/sync", {
                            "script": "return document.querySelectorAll(arguments[0]).length",
                            "args": [args[1]],
                        })
@@ -1334,14 +1833,14 @@ def cmd_get(config, args):
             sys.exit(1)
         selector = resolve_target(state, args[1])
         resp = request(config.driver, "POST",
-                       f"{surl(config.driver, sid)}/execute/sync", {
+                       f"{base}/execute/sync", {
                            "script": """
                            const r = document.querySelector(arguments[0]).getBoundingClientRect();
                            return {x: r.x, y: r.y, width: r.width, height: r.height, top: r.top, right: r.right, bottom: r.bottom, left: r.left};
                            """,
                            "args": [selector],
                        })
-        print(json.dumps(resp["value"], indent=2))
+        print(_json_pretty(resp["value"]).decode())
     elif subcmd == "styles":
         if len(args) < 2:
             print("Usage: tauri-browse get styles <@ref|selector> [prop1 prop2 ...]",
@@ -1351,7 +1850,7 @@ def cmd_get(config, args):
         props = args[2:]
         if props:
             resp = request(config.driver, "POST",
-                           f"{surl(config.driver, sid)}/execute/sync", {
+                           f"{base}/execute/sync", {
                                "script": """
                                const cs = window.getComputedStyle(document.querySelector(arguments[0]));
                                const result = {};
@@ -1362,7 +1861,7 @@ def cmd_get(config, args):
                            })
         else:
             resp = request(config.driver, "POST",
-                           f"{surl(config.driver, sid)}/execute/sync", {
+                           f"{base}/execute/sync", {
                                "script": """
                                const cs = window.getComputedStyle(document.querySelector(arguments[0]));
                                const props = ['display', 'visibility', 'opacity', 'color', 'background-color',
@@ -1374,12 +1873,63 @@ def cmd_get(config, args):
                                """,
                                "args": [selector],
                            })
-        print(json.dumps(resp["value"], indent=2))
+        print(_json_pretty(resp["value"]).decode())
     else:
         print(f"Unknown get subcommand: {subcmd}", file=sys.stderr)
         sys.exit(1)
 
 
+# Backoff intervals for wait loops
+def poll_delays(first=0.025, factor=1.5, cap=0.5):
+    delay = first
+    while True:
+        yield delay
+        delay = min(delay * factor, cap)
+
+
+# W3C default for the session script timeout, in ms.
+DEFAULT_SCRIPT_TIMEOUT = 30000
+
+
+def wait_in_page(config, sid, check, timeout_ms):
+    base = surl(config.driver, sid)
+    script = WAIT_UNTIL_JS.replace("WAIT_CHECK", check)
+    # Compile the check once so a syntax error exits with its message
+    request(config.driver, "POST", f"{base}/execute/sync",
+            {"script": f"return typeof ({check});", "args": []})
+    previous = None
+    if timeout_ms + 1000 > DEFAULT_SCRIPT_TIMEOUT:
+        resp = request(config.driver, "GET", f"{base}/timeouts")
+        previous = resp["value"].get("script", DEFAULT_SCRIPT_TIMEOUT)
+        request(config.driver, "POST", f"{base}/timeouts",
+                {"script": timeout_ms + 5000})
+    try:
+        deadline = time.time() + timeout_ms / 1000
+        delays = poll_delays()
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            resp = request(
+                config.driver, "POST", f"{base}/execute/async",
+                {"script": script, "args": [int(remaining * 1000)]},
+                timeout=remaining + config.timeout,
+                tolerate=SCRIPT_INTERRUPTED_ERRORS)
+            if resp is not None:
+                return bool(resp["value"])
+            # The page navigated away mid-wait; start again in the new document
+            time.sleep(next(delays))
+    finally:
+        if previous is not None:
+            request_quiet("POST", f"{base}/timeouts", {"script": previous})
+
+
+# After navigating: waits for the document to load, up to timeout_ms
+def wait_for_ready(config, sid, timeout_ms=10000):
+    wait_in_page(config, sid, "() => document.readyState === 'complete'",
+                 timeout_ms)
+
+
 def cmd_wait(config, args):
     if not args:
         print("Usage: tauri-browse wait <@ref|selector|ms> "
@@ -1388,6 +1938,7 @@ def cmd_wait(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
 
     if args[0] == "--url":
         if len(args) < 2:
@@ -1397,13 +1948,13 @@ def cmd_wait(config, args):
         pattern = args[1]
         timeout_ms = int(args[2]) if len(args) > 2 else 10000
         deadline = time.time() + timeout_ms / 1000
+        delays = poll_delays()
         while time.time() < deadline:
-            resp = request(config.driver, "GET",
-                           f"{surl(config.driver, sid)}/url")
+            resp = request(config.driver, "GET", f"{base}/url")
             if pattern in resp["value"]:
                 print(f"URL matched: {resp['value']}")
                 return
-            time.sleep(0.25)
+            time.sleep(next(delays))
         print(f"Timeout waiting for URL containing: {pattern}",
               file=sys.stderr)
         sys.exit(1)
@@ -1411,25 +1962,11 @@ def cmd_wait(config, args):
     if args[0] == "--load":
         strategy = args[1] if len(args) > 1 else "networkidle"
         timeout_ms = int(args[2]) if len(args) > 2 else 10000
-        deadline = time.time() + timeout_ms / 1000
         if strategy == "networkidle":
             # Wait for document.readyState complete + 500ms stability
-            settled_at = None
-            while time.time() < deadline:
-                resp = request(config.driver, "POST",
-                               f"{surl(config.driver, sid)}/execute/sync", {
-                                   "script": "return document.readyState",
-                                   "args": [],
-                               })
-                if resp["value"] == "complete":
-                    if settled_at is None:
-                        settled_at = time.time()
-                    elif time.time() - settled_at >= 0.5:
-                        print("Network idle.")
-                        return
-                else:
-                    settled_at = None
-                time.sleep(0.1)
+            if wait_in_page(config, sid, NETWORK_IDLE_CHECK, timeout_ms):
+                print("Network idle.")
+                return
             print("Timeout waiting for network idle.", file=sys.stderr)
             sys.exit(1)
         else:
@@ -1444,16 +1981,17 @@ def cmd_wait(config, args):
         text = args[1]
         timeout_ms = int(args[2]) if len(args) > 2 else 10000
         deadline = time.time() + timeout_ms / 1000
+        delays = poll_delays()
         while time.time() < deadline:
             resp = request(config.driver, "POST",
-                           f"{surl(config.driver, sid)}/execute/sync", {
+                           f"{base}/execute/sync", {
                                "script": "return document.body.innerText.includes(arguments[0])",
                                "args": [text],
                            })
             if resp["value"]:
                 print(f"Text found: {text}")
                 return
-            time.sleep(0.25)
+            time.sleep(next(delays))
         print(f"Timeout waiting for text: {text}", file=sys.stderr)
         sys.exit(1)
 
@@ -1464,17 +2002,9 @@ def cmd_wait(config, args):
             sys.exit(1)
         expr = args[1]
         timeout_ms = int(args[2]) if len(args) > 2 else 10000
-        deadline = time.time() + timeout_ms / 1000
-        while time.time() < deadline:
-            resp = request(config.driver, "POST",
-                           f"{surl(config.driver, sid)}/execute/sync", {
-                               "script": f"return !!({expr})",
-                               "args": [],
-                           })
-            if resp["value"]:
-                print("Condition met.")
-                return
-            time.sleep(0.25)
+        if wait_in_page(config, sid, f"() => !!({expr})", timeout_ms):
+            print("Condition met.")
+            return
         print(f"Timeout waiting for: {expr}", file=sys.stderr)
         sys.exit(1)
 
@@ -1488,19 +2018,50 @@ def cmd_wait(config, args):
 
     selector = resolve_target(state, target)
     timeout_ms = int(args[1]) if len(args) > 1 else 10000
-    deadline = time.time() + timeout_ms / 1000
-
-    while time.time() < deadline:
-        if try_find_element(config, sid, selector) is not None:
-            print(f"Found: {selector}")
-            return
-        time.sleep(0.25)
+    # The driver retries the lookup itself; reset so others fail fast
+    request(config.driver, "POST", f"{base}/timeouts", {"implicit": timeout_ms})
+    try:
+        resp = request(config.driver, "POST", f"{base}/element",
+                       {"using": "css selector", "value": selector},
+                       timeout=timeout_ms / 1000 + config.timeout,
+                       tolerate=("no such element",))
+    finally:
+        request_quiet("POST", f"{base}/timeouts", {"implicit": 0})
+    if resp is not None:
+        print(f"Found: {selector}")
+        return
 
     print(f"Timeout waiting for: {selector}", file=sys.stderr)
     sys.exit(1)
 
 
+def diff_lines(old_lines, new_lines):
+    # Lines only in old and lines only in new, in original order
+    old_idx = dict.fromkeys(old_lines)
+    new_idx = dict.fromkeys(new_lines)
+    removed = [l for l in old_lines if l not in new_idx]
+    added = [l for l in new_lines if l not in old_idx]
+    return removed, added
+
+
+def print_line_diff(old_lines, new_lines):
+    # Unchanged pages are the common case
+    if old_lines == new_lines:
+        print("No changes.")
+        return
+    removed, added = diff_lines(old_lines, new_lines)
+    if not removed and not added:
+        print("No changes.")
+        return
+    # One write for the whole diff rather than a print per line
+    out = [f"- {line}\n" for line in removed]
+    out.extend(f"+ {line}\n" for line in added)
+    sys.stdout.write("".join(out))
+
+
 def cmd_diff(config, args):
+    import tempfile
+
     if not args:
         print("Usage: tauri-browse diff <snapshot|screenshot|url> [options]",
               file=sys.stderr)
@@ -1508,6 +2069,7 @@ def cmd_diff(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     subcmd = args[0]
 
     if subcmd == "snapshot":
@@ -1527,23 +2089,14 @@ def cmd_diff(config, args):
                 sys.exit(1)
             old_lines = old_text.strip().splitlines()
 
-        refs, new_lines, _ = collect_snapshot(config, sid, True, None)
+        refs, new_lines, _, element_cache = collect_snapshot(
+            config, sid, True, None, want_handles=True)
         state["refs"] = refs
+        state["element_cache"] = element_cache
         state["last_snapshot"] = "\n".join(new_lines)
         save_session(config.session, state)
 
-        old_set = set(old_lines)
-        new_set = set(new_lines)
-        removed = [l for l in old_lines if l not in new_set]
-        added = [l for l in new_lines if l not in old_set]
-
-        if not removed and not added:
-            print("No changes.")
-            return
-        for line in removed:
-            print(f"- {line}")
-        for line in added:
-            print(f"+ {line}")
+        print_line_diff(old_lines, new_lines)
 
     elif subcmd == "screenshot":
         if "--baseline" not in args:
@@ -1556,13 +2109,10 @@ def cmd_diff(config, args):
                   file=sys.stderr)
             sys.exit(1)
         baseline = args[idx + 1]
-        current = os.path.join(tempfile.gettempdir(),
-                               f"tb-diff-current-{int(time.time())}.png")
-        capture_screenshot(config, sid, current)
+        current = capture_screenshot(config, sid)
         output = os.path.join(tempfile.gettempdir(),
                               f"tb-diff-{int(time.time())}.png")
         diff_screenshots(baseline, current, output)
-        os.unlink(current)
 
     elif subcmd == "url":
         if len(args) < 3:
@@ -1578,48 +2128,36 @@ def cmd_diff(config, args):
                 sel = args[si + 1]
 
         scope = sel if sel else None
+        # Both branches navigate away, so cached element ids are lost
+        reset_element_cache(config, state)
 
         if do_screenshot:
-            img1 = os.path.join(tempfile.gettempdir(), "tb-diff-url1.png")
-            img2 = os.path.join(tempfile.gettempdir(), "tb-diff-url2.png")
-
-            request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/url", {"url": url1})
-            time.sleep(1)
-            capture_screenshot(config, sid, img1)
-
-            request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/url", {"url": url2})
-            time.sleep(1)
-            capture_screenshot(config, sid, img2)
+            # Both captures stay in memory; url1's PNG may still be encoding
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                request(config.driver, "POST", f"{base}/url", {"url": url1})
+                wait_for_ready(config, sid)
+                img1 = capture_screenshot(config, sid, None, writer)
+
+                request(config.driver, "POST", f"{base}/url", {"url": url2})
+                wait_for_ready(config, sid)
+                img2 = capture_screenshot(config, sid)
+            if not isinstance(img1, bytes):
+                img1 = img1.result()
 
             output = os.path.join(tempfile.gettempdir(),
                                   f"tb-diff-url-{int(time.time())}.png")
             diff_screenshots(img1, img2, output)
-            os.unlink(img1)
-            os.unlink(img2)
         else:
-            request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/url", {"url": url1})
-            time.sleep(1)
-            _, lines1, _ = collect_snapshot(config, sid, True, scope)
+            request(config.driver, "POST", f"{base}/url", {"url": url1})
+            wait_for_ready(config, sid)
+            _, lines1, _, _ = collect_snapshot(config, sid, True, scope)
 
-            request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/url", {"url": url2})
-            time.sleep(1)
-            _, lines2, _ = collect_snapshot(config, sid, True, scope)
-
-            set1 = set(lines1)
-            set2 = set(lines2)
-            removed = [l for l in lines1 if l not in set2]
-            added = [l for l in lines2 if l not in set1]
-            if not removed and not added:
-                print("No changes.")
-            else:
-                for line in removed:
-                    print(f"- {line}")
-                for line in added:
-                    print(f"+ {line}")
+            request(config.driver, "POST", f"{base}/url", {"url": url2})
+            wait_for_ready(config, sid)
+            _, lines2, _, _ = collect_snapshot(config, sid, True, scope)
+
+            print_line_diff(lines1, lines2)
     else:
         print(f"Unknown diff subcommand: {subcmd}", file=sys.stderr)
         sys.exit(1)
@@ -1635,9 +2173,12 @@ def cmd_session(config, args):
         if not sessions:
             print("No active sessions.")
         else:
+            out = []
             for s in sessions:
                 marker = " *" if s["name"] == config.session else ""
-                print(f"  {s['name']}{marker} ({s['session_id'][:12]}...)")
+                out.append(f"  {s['name']}{marker} "
+                           f"({s['session_id'][:12]}...)\n")
+            sys.stdout.write("".join(out))
     else:
         print(f"Unknown session subcommand: {args[0]}", file=sys.stderr)
         sys.exit(1)
@@ -1658,28 +2199,33 @@ def cmd_state(config, args):
         state = load_session(config.session)
         sid = state["session_id"]
 
-        cookies = request(config.driver, "GET",
-                          f"{surl(config.driver, sid)}/cookie")["value"]
-        ls_resp = request(config.driver, "POST",
-                          f"{surl(config.driver, sid)}/execute/sync", {
-                              "script": "return JSON.stringify(localStorage)",
-                              "args": [],
-                          })
-        local_storage = json.loads(ls_resp["value"]) if ls_resp["value"] else {}
-        url = request(config.driver, "GET",
-                      f"{surl(config.driver, sid)}/url")["value"]
+        # The three reads are independent, so they go out together
+        from concurrent.futures import ThreadPoolExecutor
+        base = surl(config.driver, sid)
+        ls_script = ("return Object.fromEntries(Object.keys(localStorage)"
+                     ".map(k => [k, localStorage.getItem(k)]))")
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            cookies = pool.submit(request, config.driver, "GET",
+                                  f"{base}/cookie")
+            ls_resp = pool.submit(request, config.driver, "POST",
+                                  f"{base}/execute/sync",
+                                  {"script": ls_script, "args": []})
+            url = pool.submit(request, config.driver, "GET", f"{base}/url")
+        cookies = cookies.result()["value"]
+        local_storage = ls_resp.result()["value"] or {}
+        url = url.result()["value"]
 
         save_path = args[1]
         if not os.path.isabs(save_path):
             ensure_dirs()
             save_path = str(STATES_DIR / save_path)
 
-        with open(save_path, "w") as f:
-            json.dump({
+        with open(save_path, "wb") as f:
+            f.write(_json_pretty({
                 "cookies": cookies,
                 "localStorage": local_storage,
                 "url": url,
-            }, f, indent=2)
+            }))
         print(f"State saved: {save_path}")
 
     elif subcmd == "load":
@@ -1688,32 +2234,39 @@ def cmd_state(config, args):
             sys.exit(1)
         state = load_session(config.session)
         sid = state["session_id"]
+        base = surl(config.driver, sid)
 
         load_path = args[1]
         if not os.path.isabs(load_path) and not os.path.exists(load_path):
             load_path = str(STATES_DIR / load_path)
 
-        with open(load_path) as f:
-            data = json.load(f)
+        with open(load_path, "rb") as f:
+            data = _json_loads(f.read())
 
         if data.get("url"):
-            request(config.driver, "POST", f"{surl(config.driver, sid)}/url",
+            request(config.driver, "POST", f"{base}/url",
                     {"url": data["url"]})
-            time.sleep(1)
-
-        for cookie in data.get("cookies", []):
-            request_quiet("POST",
-                          f"{surl(config.driver, sid)}/cookie",
-                          {"cookie": cookie})
+            reset_element_cache(config, state)
+            wait_for_ready(config, sid)
+
+        # WebDriver adds one cookie per request; send them concurrently
+        cookies = data.get("cookies", [])
+        if cookies:
+            from concurrent.futures import ThreadPoolExecutor
+            cookie_url = f"{base}/cookie"
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(
+                    lambda c: request_quiet("POST", cookie_url, {"cookie": c}),
+                    cookies))
 
         ls = data.get("localStorage", {})
         if ls:
-            for key, value in ls.items():
-                request(config.driver, "POST",
-                        f"{surl(config.driver, sid)}/execute/sync", {
-                            "script": "localStorage.setItem(arguments[0], arguments[1])",
-                            "args": [key, value],
-                        })
+            request(config.driver, "POST",
+                    f"{base}/execute/sync", {
+                        "script": "const items = arguments[0];\n"
+                                  "for (const k in items) localStorage.setItem(k, items[k]);",
+                        "args": [ls],
+                    })
         print(f"State loaded: {load_path}")
 
     elif subcmd == "list":
@@ -1753,9 +2306,9 @@ def cmd_state(config, args):
         if not target.suffix:
             target = target.with_suffix(".json")
         try:
-            with open(target) as f:
-                data = json.load(f)
-            print(json.dumps(data, indent=2))
+            with open(target, "rb") as f:
+                data = _json_loads(f.read())
+            print(_json_pretty(data).decode())
         except FileNotFoundError:
             print(f"Not found: {target.name}", file=sys.stderr)
             sys.exit(1)
@@ -1789,8 +2342,8 @@ def cmd_state(config, args):
         removed = 0
         for f in STATES_DIR.glob("*.json"):
             try:
-                with open(f) as fh:
-                    data = json.load(fh)
+                with open(f, "rb") as fh:
+                    data = _json_loads(fh.read())
                 if not data:
                     f.unlink()
                     removed += 1
@@ -1808,6 +2361,7 @@ def cmd_back(config, _args):
     state = load_session(config.session)
     sid = state["session_id"]
     request(config.driver, "POST", f"{surl(config.driver, sid)}/back", {})
+    reset_element_cache(config, state)
     print("Navigated back.")
 
 
@@ -1815,6 +2369,7 @@ def cmd_forward(config, _args):
     state = load_session(config.session)
     sid = state["session_id"]
     request(config.driver, "POST", f"{surl(config.driver, sid)}/forward", {})
+    reset_element_cache(config, state)
     print("Navigated forward.")
 
 
@@ -1822,6 +2377,7 @@ def cmd_reload(config, _args):
     state = load_session(config.session)
     sid = state["session_id"]
     request(config.driver, "POST", f"{surl(config.driver, sid)}/refresh", {})
+    reset_element_cache(config, state)
     print("Reloaded.")
 
 
@@ -1942,16 +2498,17 @@ def cmd_uncheck(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     selector = resolve_target(state, args[0])
     resp = request(config.driver, "POST",
-                   f"{surl(config.driver, sid)}/execute/sync", {
+                   f"{base}/execute/sync", {
                        "script": "return !!document.querySelector(arguments[0]).checked",
                        "args": [selector],
                    })
     if resp["value"]:
         element_id = find_element(config, sid, selector)
         request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/element/{element_id}/click", {})
+                f"{base}/element/{element_id}/click", {})
         print("Unchecked.")
     else:
         print("Already unchecked.")
@@ -2042,16 +2599,17 @@ def cmd_frame(config, args):
 
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
 
     if args[0] == "main":
         request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/frame", {"id": None})
+                f"{base}/frame", {"id": None})
         print("Switched to main frame.")
     else:
         selector = resolve_target(state, args[0])
         element_id = find_element(config, sid, selector)
         request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/frame",
+                f"{base}/frame",
                 {"id": element_origin(element_id)})
         print("Switched to frame.")
 
@@ -2139,6 +2697,7 @@ def _inject_console(config, sid):
 def cmd_console(config, args):
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     do_clear = "--clear" in args
     level_filter = None
     if "--level" in args:
@@ -2147,7 +2706,7 @@ def cmd_console(config, args):
             level_filter = args[idx + 1]
 
     resp = request(config.driver, "POST",
-                   f"{surl(config.driver, sid)}/execute/sync", {
+                   f"{base}/execute/sync", {
                        "script": "return window.__TAURI_BROWSE_CONSOLE__ || []",
                        "args": [],
                    })
@@ -2163,13 +2722,13 @@ def cmd_console(config, args):
     if do_clear:
         if level_filter:
             request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/execute/sync", {
+                    f"{base}/execute/sync", {
                         "script": "window.__TAURI_BROWSE_CONSOLE__ = (window.__TAURI_BROWSE_CONSOLE__ || []).filter(e => e.level !== arguments[0])",
                         "args": [level_filter],
                     })
         else:
             request(config.driver, "POST",
-                    f"{surl(config.driver, sid)}/execute/sync", {
+                    f"{base}/execute/sync", {
                         "script": "window.__TAURI_BROWSE_CONSOLE__ = []",
                         "args": [],
                     })
@@ -2181,10 +2740,11 @@ def cmd_console(config, args):
 def cmd_errors(config, args):
     state = load_session(config.session)
     sid = state["session_id"]
+    base = surl(config.driver, sid)
     do_clear = "--clear" in args
 
     resp = request(config.driver, "POST",
-                   f"{surl(config.driver, sid)}/execute/sync", {
+                   f"{base}/execute/sync", {
                        "script": "return (window.__TAURI_BROWSE_CONSOLE__ || []).filter(e => e.level === 'error')",
                        "args": [],
                    })
@@ -2196,7 +2756,7 @@ def cmd_errors(config, args):
 
     if do_clear:
         request(config.driver, "POST",
-                f"{surl(config.driver, sid)}/execute/sync", {
+                f"{base}/execute/sync", {
                     "script": "window.__TAURI_BROWSE_CONSOLE__ = (window.__TAURI_BROWSE_CONSOLE__ || []).filter(e => e.level !== 'error')",
                     "args": [],
                 })
@@ -2249,9 +2809,22 @@ COMMANDS = {
 }
 
 
-BOOL_FLAGS = {"--json", "--full", "--annotate", "--debug"}
-VALUE_FLAGS = {"--session", "--session-name", "--driver", "--display",
-               "--config", "--timeout", "--download-path"}
+# Global flags mapped to their cli_flags keys
+BOOL_FLAGS = {
+    "--json": "json",
+    "--full": "full",
+    "--annotate": "annotate",
+    "--debug": "debug",
+}
+VALUE_FLAGS = {
+    "--session": "session",
+    "--session-name": "sessionName",
+    "--driver": "driver",
+    "--display": "display",
+    "--config": "config",
+    "--timeout": "timeout",
+    "--download-path": "downloadPath",
+}
 
 
 def _parse_bool_flag(args, i):
@@ -2278,15 +2851,10 @@ def main():
         arg = argv[i]
         if arg in BOOL_FLAGS:
             val, consumed = _parse_bool_flag(argv, i)
-            key = arg.lstrip("-").replace("-", "_")
-            cli_flags[key] = val
+            cli_flags[BOOL_FLAGS[arg]] = val
             i += 2 if consumed else 1
         elif arg in VALUE_FLAGS and i + 1 < len(argv):
-            key = arg.lstrip("-")
-            # Convert kebab-case to camelCase
-            parts = key.split("-")
-            key = parts[0] + "".join(p.capitalize() for p in parts[1:])
-            cli_flags[key] = argv[i + 1]
+            cli_flags[VALUE_FLAGS[arg]] = argv[i + 1]
             i += 2
         else:
             remaining = argv[i:]
@@ -0,0 +1,63 @@
+"""Tests for the Pillow screenshot diff in tauri_browse.py."""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import tauri_browse  # noqa: E402
+
+BASE = (100, 100, 100)
+
+
+def png(size=(10, 10), color=BASE, pixel=None):
+    im = Image.new("RGB", size, color)
+    if pixel is not None:
+        im.putpixel((0, 0), pixel)
+    buf = io.BytesIO()
+    im.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def diff(tmp_path, capsys):
+    def run(baseline, current):
+        tauri_browse.diff_screenshots(baseline, current, tmp_path / "diff.png")
+        return capsys.readouterr().out
+    return run
+
+
+class TestDiffScreenshots:
+    def test_identical_images(self, diff, tmp_path):
+        assert "Diff pixels: 0 (0.00%)" in diff(png(), png())
+        assert (tmp_path / "diff.png").exists()
+
+    def test_change_under_fuzz_is_ignored(self, diff):
+        assert "Diff pixels: 0 (0.00%)" in diff(png(), png(pixel=(112,) * 3))
+
+    def test_change_over_fuzz_is_counted(self, diff):
+        assert "Diff pixels: 1 (1.00%)" in diff(png(), png(pixel=(113,) * 3))
+
+    def test_size_mismatch(self, diff):
+        out = diff(png(), png(size=(20, 10)))
+        assert "image sizes differ (10x10 vs 20x10)" in out
+
+
+class TestUnreadableImages:
+    def test_missing_baseline(self, tmp_path, capsys):
+        with pytest.raises(SystemExit) as exc:
+            tauri_browse.diff_screenshots(
+                tmp_path / "missing.png", png(), tmp_path / "diff.png")
+        assert exc.value.code == 1
+        assert "Error: cannot read baseline" in capsys.readouterr().err
+
+    def test_current_not_an_image(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            tauri_browse.diff_screenshots(
+                png(), b"not a png", tmp_path / "diff.png")
+        assert "Error: cannot read current image" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 """Tests for the tauri-dogfood skill file structure and content consistency."""
 
+import functools
 import re
 from pathlib import Path
 
@@ -10,21 +11,36 @@ SKILL_MD = SKILL_DIR / "SKILL.md"
 TAXONOMY_MD = SKILL_DIR / "references" / "issue-taxonomy.md"
 TEMPLATE_MD = SKILL_DIR / "templates" / "dogfood-report-template.md"
 
+FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+FRONTMATTER_FIELD_RE = re.compile(
+    r"^[ \t]*([^:\n]+?)[ \t]*:[ \t]*(.*?)[ \t]*$", re.MULTILINE
+)
+FILE_REF_RE = re.compile(r"\[.*?\]\((references/.*?\.md|templates/.*?\.md)\)")
+SCREENSHOT_REF_RE = re.compile(r"!\[.*?\]\(screenshots/")
+SEVERITY_LIST_RE = re.compile(r"critical\s*/\s*high\s*/\s*medium\s*/\s*low")
+NUMBERED_ITEM_RE = re.compile(r"^\d+\.", re.MULTILINE)
 
+
+# Files are read once per session; every fixture gets the same str.
+@functools.lru_cache(maxsize=None)
 def read_skill_file(path: Path) -> str:
     return path.read_text()
 
 
+@functools.lru_cache(maxsize=None)
+def category_heading_re(category: str) -> re.Pattern[str]:
+    return re.compile(rf"###\s+.*{category}", re.IGNORECASE)
+
+
 def parse_frontmatter(content: str) -> dict[str, str]:
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    if not content.startswith("---\n"):
+        return {}
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return {}
-    fields: dict[str, str] = {}
-    for line in match.group(1).split("\n"):
-        colon = line.find(":")
-        if colon > 0:
-            fields[line[:colon].strip()] = line[colon + 1 :].strip()
-    return fields
+    return {
+        m.group(1): m.group(2) for m in FRONTMATTER_FIELD_RE.finditer(match.group(1))
+    }
 
 
 class TestFileStructure:
@@ -68,9 +84,7 @@ class TestSkillBodyReferences:
         assert "templates/dogfood-report-template.md" in self.content
 
     def test_referenced_files_exist(self):
-        refs = re.findall(
-            r"\[.*?\]\((references/.*?\.md|templates/.*?\.md)\)", self.content
-        )
+        refs = FILE_REF_RE.findall(self.content)
         assert len(refs) > 0
         for ref in refs:
             full_path = SKILL_DIR / ref
@@ -98,10 +112,10 @@ class TestReportTemplate:
         assert "**Repro Steps**" in self.template
 
     def test_has_screenshot_refs(self):
-        assert re.search(r"!\[.*?\]\(screenshots/", self.template)
+        assert SCREENSHOT_REF_RE.search(self.template)
 
     def test_lists_all_severity_values(self):
-        assert re.search(r"critical\s*/\s*high\s*/\s*medium\s*/\s*low", self.template)
+        assert SEVERITY_LIST_RE.search(self.template)
 
     def test_lists_all_category_values(self):
         category_line = next(
@@ -146,14 +160,14 @@ class TestIssueTaxonomy:
             "Accessibility",
         ]
         for cat in expected:
-            assert re.search(rf"###\s+.*{cat}", self.taxonomy, re.IGNORECASE)
+            assert category_heading_re(cat).search(self.taxonomy)
 
     def test_has_exploration_checklist(self):
         assert "## Exploration Checklist" in self.taxonomy
 
     def test_checklist_has_numbered_items(self):
         checklist = self.taxonomy.split("## Exploration Checklist")[1]
-        numbered = re.findall(r"^\d+\.", checklist, re.MULTILINE)
+        numbered = NUMBERED_ITEM_RE.findall(checklist)
         assert len(numbered) >= 5
 
 
@@ -174,8 +188,8 @@ class TestCrossConsistency:
             if c.strip()
         ]
         for cat in categories:
-            assert re.search(
-                rf"###\s+.*{cat}", self.taxonomy, re.IGNORECASE
+            assert category_heading_re(cat).search(
+                self.taxonomy
             ), f'Category "{cat}" from template not found in taxonomy'
 
     def test_every_template_severity_in_taxonomy(self):
@@ -0,0 +1,97 @@
+"""Tests for find resolution in tauri_browse.py against a fake driver."""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import tauri_browse  # noqa: E402
+
+
+class AppendingList:
+    """A page whose every click appends another .item to the list."""
+
+    def __init__(self):
+        self.items = ["item-1"]
+        self.clicked = []
+
+    def __call__(self, method, url, body=None, timeout=None):
+        if url.endswith("/execute/sync") and body["script"] == tauri_browse.FIND_JS:
+            last = self.items[-1]
+            value = [f".item:nth-of-type({len(self.items)})",
+                     {tauri_browse.W3C_ELEMENT_KEY: last}]
+        elif url.endswith("/click"):
+            self.clicked.append(url.split("/")[-2])
+            self.items.append(f"item-{len(self.items) + 1}")
+            value = None
+        else:
+            value = None
+        return 200, json.dumps({"value": value}).encode()
+
+
+class PrependingToasts:
+    """A page whose every click inserts a new .toast before the others."""
+
+    def __init__(self):
+        self.toasts = ["toast-1"]
+        self.clicked = []
+
+    def __call__(self, method, url, body=None, timeout=None):
+        if url.endswith("/element"):
+            value = {tauri_browse.W3C_ELEMENT_KEY: self.toasts[0]}
+        elif url.endswith("/click"):
+            self.clicked.append(url.split("/")[-2])
+            self.toasts.insert(0, f"toast-{len(self.toasts) + 1}")
+            value = None
+        else:
+            value = None
+        return 200, json.dumps({"value": value}).encode()
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setattr(tauri_browse, "SESSIONS_DIR", tmp_path / "sessions")
+    monkeypatch.setattr(tauri_browse, "STATES_DIR", tmp_path / "states")
+    monkeypatch.setattr(tauri_browse, "_state_cache", {})
+    config = types.SimpleNamespace(
+        session="test", driver="http://driver", timeout=5)
+    tauri_browse.save_session(config.session, {
+        "session_id": "sid", "refs": {}, "element_cache": {},
+        "last_snapshot": "", "last_screenshot": "",
+    })
+    return config
+
+
+class TestFind:
+    def test_repeated_find_sees_new_elements(self, config, monkeypatch):
+        page = AppendingList()
+        monkeypatch.setattr(tauri_browse, "http_call", page)
+        for _ in range(3):
+            tauri_browse.cmd_find(config, ["last", ".item", "click"])
+        assert page.clicked == ["item-1", "item-2", "item-3"]
+
+    def test_css_selectors_are_looked_up_every_time(self, config, monkeypatch):
+        page = PrependingToasts()
+        monkeypatch.setattr(tauri_browse, "http_call", page)
+        tauri_browse.cmd_find(config, ["first", ".toast", "click"])
+        tauri_browse.cmd_click(config, [".toast"])
+        tauri_browse.cmd_click(config, [".toast"])
+        assert page.clicked == ["toast-1", "toast-2", "toast-3"]
+        assert not tauri_browse.load_session(config.session)["element_cache"]
+
+    def test_snapshot_refs_reuse_the_cached_id(self, config, monkeypatch):
+        state = tauri_browse.load_session(config.session)
+        state["refs"] = {"@e1": "#a"}
+        state["element_cache"] = {"#a": "id-a"}
+        tauri_browse.save_session(config.session, state)
+        urls = []
+        monkeypatch.setattr(
+            tauri_browse, "http_call",
+            lambda method, url, body=None, timeout=None:
+                urls.append(url) or (200, b'{"value": null}'))
+        tauri_browse.cmd_find(config, ["first", "@e1", "click"])
+        tauri_browse.cmd_click(config, ["@e1"])
+        assert urls == ["http://driver/session/sid/element/id-a/click"] * 2
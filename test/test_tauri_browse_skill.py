@@ -1,34 +1,51 @@
 """Tests for the tauri-browse skill file structure and content consistency."""
 
+import functools
+import os
 import re
 from pathlib import Path
 
 import pytest
 
-SKILL_DIR = Path(__file__).parent.parent / "skills" / "tauri-browse"
+SKILLS_ROOT = (Path(__file__).parent.parent / "skills").resolve()
+SKILL_DIR = SKILLS_ROOT / "tauri-browse"
 SKILL_MD = SKILL_DIR / "SKILL.md"
 COMMANDS_MD = SKILL_DIR / "references" / "commands.md"
 SNAPSHOT_REFS_MD = SKILL_DIR / "references" / "snapshot-refs.md"
 SESSION_MD = SKILL_DIR / "references" / "session-management.md"
 AUTH_MD = SKILL_DIR / "references" / "authentication.md"
+DOGFOOD_SKILL_MD = SKILLS_ROOT / "tauri-dogfood" / "SKILL.md"
+ALL_SKILL_FILES = [SKILL_MD, COMMANDS_MD, SNAPSHOT_REFS_MD, SESSION_MD, AUTH_MD]
 
+VIDEO_RE = re.compile(r"record start|record stop|\.webm|Repro Video")
+FILE_REF_RE = re.compile(r"\[.*?\]\((references/.*?\.md|templates/.*?\.(?:md|sh))\)")
 
+
+# The content fixtures and the agent-browser scan share one read per file.
+@functools.lru_cache(maxsize=None)
 def read_skill_file(path: Path) -> str:
-    return path.read_text()
+    return path.read_text(encoding="utf-8")
 
 
 def parse_frontmatter(content: str) -> dict[str, str]:
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    if not content.startswith("---\n"):
+        return {}
+    end = content.find("\n---", 4)
+    if end < 0:
         return {}
     fields: dict[str, str] = {}
-    for line in match.group(1).split("\n"):
-        colon = line.find(":")
-        if colon > 0:
-            fields[line[:colon].strip()] = line[colon + 1 :].strip()
+    for line in content[4:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key:
+            fields[key.strip()] = value.strip()
     return fields
 
 
+def has_section(sections: set[str], name: str) -> bool:
+    # Headings may carry a qualifier, e.g. "## Snapshot (page analysis)"
+    return any(title.startswith(name) for title in sections)
+
+
 class TestFileStructure:
     def test_skill_md_exists(self):
         assert SKILL_MD.exists()
@@ -46,206 +63,207 @@ class TestFileStructure:
         assert AUTH_MD.exists()
 
     def test_templates_exist(self):
-        templates = SKILL_DIR / "templates"
-        assert (templates / "form-automation.sh").exists()
-        assert (templates / "authenticated-session.sh").exists()
-        assert (templates / "capture-workflow.sh").exists()
+        names = {entry.name for entry in os.scandir(SKILL_DIR / "templates")}
+        expected = {
+            "form-automation.sh",
+            "authenticated-session.sh",
+            "capture-workflow.sh",
+        }
+        assert expected <= names, f"Missing: {sorted(expected - names)}"
 
 
-class TestSkillFrontmatter:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(SKILL_MD)
-        self.fm = parse_frontmatter(self.content)
+@pytest.fixture(scope="session")
+def skill_content() -> str:
+    return read_skill_file(SKILL_MD)
 
-    def test_has_name(self):
-        assert self.fm.get("name") == "tauri-browse"
 
-    def test_has_description(self):
-        assert self.fm.get("description")
-        assert len(self.fm["description"]) > 50
+@pytest.fixture(scope="session")
+def commands_content() -> str:
+    return read_skill_file(COMMANDS_MD)
 
-    def test_has_allowed_tools(self):
-        assert self.fm.get("allowed-tools")
-        assert "tauri-browse" in self.fm["allowed-tools"]
 
+@pytest.fixture(scope="session")
+def snapshot_refs_content() -> str:
+    return read_skill_file(SNAPSHOT_REFS_MD)
 
-class TestSkillBodyReferences:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(SKILL_MD)
 
-    def test_references_commands(self):
-        assert "references/commands.md" in self.content
+@pytest.fixture(scope="session")
+def session_content() -> str:
+    return read_skill_file(SESSION_MD)
 
-    def test_references_snapshot_refs(self):
-        assert "references/snapshot-refs.md" in self.content
 
-    def test_references_session_management(self):
-        assert "references/session-management.md" in self.content
+@pytest.fixture(scope="session")
+def auth_content() -> str:
+    return read_skill_file(AUTH_MD)
 
-    def test_references_authentication(self):
-        assert "references/authentication.md" in self.content
 
-    def test_referenced_files_exist(self):
-        refs = re.findall(
-            r"\[.*?\]\((references/.*?\.md|templates/.*?\.(?:md|sh))\)", self.content
-        )
-        assert len(refs) > 0
-        for ref in refs:
-            full_path = SKILL_DIR / ref
-            assert full_path.exists(), f"Missing: {ref}"
+@pytest.fixture(scope="session")
+def dogfood_skill_content() -> str:
+    return read_skill_file(DOGFOOD_SKILL_MD)
 
-    def test_no_agent_browser_references(self):
-        assert "agent-browser" not in self.content
 
+@pytest.fixture(scope="session")
+def skill_frontmatter(skill_content) -> dict[str, str]:
+    return parse_frontmatter(skill_content)
 
-class TestCommandsReference:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(COMMANDS_MD)
 
-    def test_has_navigation_section(self):
-        assert "## Navigation" in self.content
+class TestSkillFrontmatter:
+    def test_has_name(self, skill_frontmatter):
+        assert skill_frontmatter.get("name") == "tauri-browse"
 
-    def test_has_snapshot_section(self):
-        assert "## Snapshot" in self.content
+    def test_has_description(self, skill_frontmatter):
+        assert skill_frontmatter.get("description")
+        assert len(skill_frontmatter["description"]) > 50
 
-    def test_has_interactions_section(self):
-        assert "## Interactions" in self.content
+    def test_has_allowed_tools(self, skill_frontmatter):
+        assert skill_frontmatter.get("allowed-tools")
+        assert "tauri-browse" in skill_frontmatter["allowed-tools"]
 
-    def test_has_screenshot_section(self):
-        assert "## Screenshots" in self.content
 
-    def test_has_wait_section(self):
-        assert "## Wait" in self.content
+class TestSkillBodyReferences:
+    def test_references_commands(self, skill_content):
+        assert "references/commands.md" in skill_content
 
-    def test_has_frames_section(self):
-        assert "## Frames" in self.content
+    def test_references_snapshot_refs(self, skill_content):
+        assert "references/snapshot-refs.md" in skill_content
 
-    def test_has_dialogs_section(self):
-        assert "## Dialogs" in self.content
+    def test_references_session_management(self, skill_content):
+        assert "references/session-management.md" in skill_content
 
-    def test_has_console_section(self):
-        assert "## Console" in self.content
+    def test_references_authentication(self, skill_content):
+        assert "references/authentication.md" in skill_content
 
-    def test_has_state_checks_section(self):
-        assert "## State Checks" in self.content
+    def test_referenced_files_exist(self, skill_content):
+        found_any = False
+        for match in FILE_REF_RE.finditer(skill_content):
+            found_any = True
+            ref = match.group(1)
+            assert (SKILL_DIR / ref).exists(), f"Missing: {ref}"
+        assert found_any
 
-    def test_has_file_handling_section(self):
-        assert "## File Handling" in self.content
 
-    def test_uses_tauri_browse_command(self):
-        assert "tauri-browse" in self.content
+@pytest.fixture(scope="session")
+def commands_sections(commands_content) -> set[str]:
+    # Titles of the "## " headings, collected in one pass over the file
+    return {
+        line[3:] for line in commands_content.splitlines() if line.startswith("## ")
+    }
 
-    def test_no_agent_browser_references(self):
-        assert "agent-browser" not in self.content
 
-    def test_documents_launch_command(self):
-        assert "tauri-browse launch" in self.content
+class TestCommandsReference:
+    def test_has_navigation_section(self, commands_sections):
+        assert has_section(commands_sections, "Navigation")
 
-    def test_documents_environment_variables(self):
-        assert "TAURI_BROWSE_" in self.content
+    def test_has_snapshot_section(self, commands_sections):
+        assert has_section(commands_sections, "Snapshot")
 
-    def test_documents_new_navigation_commands(self):
-        assert "tauri-browse back" in self.content
-        assert "tauri-browse forward" in self.content
-        assert "tauri-browse reload" in self.content
+    def test_has_interactions_section(self, commands_sections):
+        assert has_section(commands_sections, "Interactions")
 
-    def test_documents_new_interaction_commands(self):
-        assert "tauri-browse dblclick" in self.content
-        assert "tauri-browse hover" in self.content
-        assert "tauri-browse focus" in self.content
-        assert "tauri-browse drag" in self.content
-        assert "tauri-browse uncheck" in self.content
-        assert "tauri-browse scrollintoview" in self.content
+    def test_has_screenshot_section(self, commands_sections):
+        assert has_section(commands_sections, "Screenshots")
 
-    def test_documents_new_get_subcommands(self):
-        assert "get html" in self.content
-        assert "get value" in self.content
-        assert "get attr" in self.content
-        assert "get count" in self.content
-        assert "get box" in self.content
-        assert "get styles" in self.content
+    def test_has_wait_section(self, commands_sections):
+        assert has_section(commands_sections, "Wait")
 
-    def test_documents_new_find_strategies(self):
-        assert "find alt" in self.content
-        assert "find title" in self.content
-        assert "find first" in self.content
-        assert "find last" in self.content
-        assert "find nth" in self.content
+    def test_has_frames_section(self, commands_sections):
+        assert has_section(commands_sections, "Frames")
 
-    def test_documents_state_management_commands(self):
-        assert "state show" in self.content
-        assert "state rename" in self.content
-        assert "state clean" in self.content
+    def test_has_dialogs_section(self, commands_sections):
+        assert has_section(commands_sections, "Dialogs")
 
+    def test_has_console_section(self, commands_sections):
+        assert has_section(commands_sections, "Console")
 
-class TestSnapshotRefsReference:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(SNAPSHOT_REFS_MD)
+    def test_has_state_checks_section(self, commands_sections):
+        assert has_section(commands_sections, "State Checks")
 
-    def test_has_ref_lifecycle(self):
-        assert "## Ref Lifecycle" in self.content
+    def test_has_file_handling_section(self, commands_sections):
+        assert has_section(commands_sections, "File Handling")
 
-    def test_has_best_practices(self):
-        assert "## Best Practices" in self.content
+    def test_uses_tauri_browse_command(self, commands_content):
+        assert "tauri-browse" in commands_content
 
-    def test_no_agent_browser_references(self):
-        assert "agent-browser" not in self.content
+    def test_documents_launch_command(self, commands_content):
+        assert "tauri-browse launch" in commands_content
 
+    def test_documents_environment_variables(self, commands_content):
+        assert "TAURI_BROWSE_" in commands_content
 
-class TestSessionManagementReference:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(SESSION_MD)
+    def test_documents_new_navigation_commands(self, commands_content):
+        assert "tauri-browse back" in commands_content
+        assert "tauri-browse forward" in commands_content
+        assert "tauri-browse reload" in commands_content
 
-    def test_has_named_sessions(self):
-        assert "## Named Sessions" in self.content
+    def test_documents_new_interaction_commands(self, commands_content):
+        assert "tauri-browse dblclick" in commands_content
+        assert "tauri-browse hover" in commands_content
+        assert "tauri-browse focus" in commands_content
+        assert "tauri-browse drag" in commands_content
+        assert "tauri-browse uncheck" in commands_content
+        assert "tauri-browse scrollintoview" in commands_content
 
-    def test_has_state_persistence(self):
-        assert "## Session State Persistence" in self.content
+    def test_documents_new_get_subcommands(self, commands_content):
+        assert "get html" in commands_content
+        assert "get value" in commands_content
+        assert "get attr" in commands_content
+        assert "get count" in commands_content
+        assert "get box" in commands_content
+        assert "get styles" in commands_content
 
-    def test_no_agent_browser_references(self):
-        assert "agent-browser" not in self.content
+    def test_documents_new_find_strategies(self, commands_content):
+        assert "find alt" in commands_content
+        assert "find title" in commands_content
+        assert "find first" in commands_content
+        assert "find last" in commands_content
+        assert "find nth" in commands_content
+
+    def test_documents_state_management_commands(self, commands_content):
+        assert "state show" in commands_content
+        assert "state rename" in commands_content
+        assert "state clean" in commands_content
+
+
+class TestSnapshotRefsReference:
+    def test_has_ref_lifecycle(self, snapshot_refs_content):
+        assert "## Ref Lifecycle" in snapshot_refs_content
+
+    def test_has_best_practices(self, snapshot_refs_content):
+        assert "## Best Practices" in snapshot_refs_content
+
+
+class TestSessionManagementReference:
+    def test_has_named_sessions(self, session_content):
+        assert "## Named Sessions" in session_content
+
+    def test_has_state_persistence(self, session_content):
+        assert "## Session State Persistence" in session_content
 
 
 class TestAuthenticationReference:
-    @pytest.fixture(autouse=True)
-    def _load(self):
-        self.content = read_skill_file(AUTH_MD)
+    def test_has_basic_login(self, auth_content):
+        assert "## Basic Login Flow" in auth_content
 
-    def test_has_basic_login(self):
-        assert "## Basic Login Flow" in self.content
+    def test_has_state_saving(self, auth_content):
+        assert "## Saving Authentication State" in auth_content
 
-    def test_has_state_saving(self):
-        assert "## Saving Authentication State" in self.content
 
-    def test_no_agent_browser_references(self):
-        assert "agent-browser" not in self.content
+@pytest.mark.parametrize("path", ALL_SKILL_FILES, ids=lambda p: p.name)
+def test_no_agent_browser_references(path):
+    assert "agent-browser" not in read_skill_file(path)
 
 
 class TestNoVideoReferences:
     """Verify video recording content was removed from all skills."""
 
-    def test_tauri_browse_skill_no_video(self):
-        content = read_skill_file(SKILL_MD)
-        assert "record start" not in content
-        assert "record stop" not in content
-        assert ".webm" not in content
-
-    def test_commands_no_video(self):
-        content = read_skill_file(COMMANDS_MD)
-        assert "## Video Recording" not in content
-        assert "record start" not in content
-
-    def test_dogfood_skill_no_video(self):
-        dogfood_skill = (
-            Path(__file__).parent.parent / "skills" / "tauri-dogfood" / "SKILL.md"
-        )
-        content = read_skill_file(dogfood_skill)
-        assert "record start" not in content
-        assert "record stop" not in content
-        assert ".webm" not in content
-        assert "Repro Video" not in content
+    def test_tauri_browse_skill_no_video(self, skill_content):
+        match = VIDEO_RE.search(skill_content)
+        assert match is None, f"Found {match.group()!r}"
+
+    def test_commands_no_video(self, commands_content):
+        assert "## Video Recording" not in commands_content
+        assert "record start" not in commands_content
+
+    def test_dogfood_skill_no_video(self, dogfood_skill_content):
+        match = VIDEO_RE.search(dogfood_skill_content)
+        assert match is None, f"Found {match.group()!r}"